@@ -1,10 +1,7 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 from database import FinanceDatabase
-import plotly.express as px
-import plotly.graph_objects as go
 
 # Page configuration
 st.set_page_config(
@@ -55,11 +52,102 @@ def get_database():
 
 db = get_database()
 
+# Cached query wrappers
+# Streamlit re-executes the whole script on every widget interaction, so the
+# hot read queries are memoized for a short TTL and invalidated after writes.
+@st.cache_data(ttl=60)
+def _transactions(user_id, start_date, end_date, category=None, limit=None):
+    return db.get_transactions(user_id, start_date, end_date, category, limit=limit)
+
+@st.cache_data(ttl=60)
+def _expense_by_category(user_id, start_date, end_date):
+    return db.get_expense_by_category(user_id, start_date, end_date)
+
+@st.cache_data(ttl=60)
+def _monthly_trend(user_id):
+    return db.get_monthly_trend(user_id)
+
+# Categories change far less often than transactions, so they get a longer TTL
+@st.cache_data(ttl=300)
+def _categories(user_id):
+    return db.get_all_categories(user_id)
+
+@st.cache_data(ttl=60)
+def _dashboard_bundle(user_id, start_date, end_date, limit=None, columns=None):
+    return db.get_dashboard_bundle(user_id, start_date, end_date, limit=limit, columns=columns)
+
+@st.cache_data(ttl=60)
+def _transactions_csv(user_id, start_date, end_date, category=None):
+    return _transactions(user_id, start_date, end_date, category).to_csv(index=False).encode()
+
+def _clear_query_caches():
+    """Invalidate all cached query results after a write"""
+    _transactions.clear()
+    _expense_by_category.clear()
+    _monthly_trend.clear()
+    _categories.clear()
+    _dashboard_bundle.clear()
+    _transactions_csv.clear()
+    _pie_figure.clear()
+    _trend_figure.clear()
+
 # Predefined categories
 INCOME_CATEGORIES = ["Salary", "Freelance", "Investment", "Gift", "Other Income"]
-EXPENSE_CATEGORIES = ["Food", "Transport", "Shopping", "Bills", "Entertainment", 
+EXPENSE_CATEGORIES = ["Food", "Transport", "Shopping", "Bills", "Entertainment",
                       "Healthcare", "Education", "Rent", "Other Expense"]
 
+@st.cache_resource
+def _category_palette():
+    """Fixed category -> color mapping, computed once per process"""
+    import plotly.express as px
+    palette = px.colors.qualitative.Set3
+    categories = INCOME_CATEGORIES + EXPENSE_CATEGORIES + ["Other"]
+    return {c: palette[i % len(palette)] for i, c in enumerate(categories)}
+
+# Figure construction is memoized on the input frame so reruns with unchanged
+# data reuse the built figure instead of reassembling traces and layout.
+@st.cache_data(ttl=60)
+def _pie_figure(plot_df):
+    import plotly.express as px
+    return px.pie(
+        plot_df,
+        values='amount',
+        names='category',
+        color='category',
+        color_discrete_map=_category_palette(),
+        title='Expense Distribution by Category'
+    )
+
+@st.cache_data(ttl=60)
+def _trend_figure(trend_pivot):
+    import plotly.graph_objects as go
+    fig = go.Figure()
+
+    if 'Income' in trend_pivot.columns:
+        fig.add_trace(go.Scatter(
+            x=trend_pivot.index,
+            y=trend_pivot['Income'],
+            mode='lines+markers',
+            name='Income',
+            line=dict(color='#4CAF50', width=2)
+        ))
+
+    if 'Expense' in trend_pivot.columns:
+        fig.add_trace(go.Scatter(
+            x=trend_pivot.index,
+            y=trend_pivot['Expense'],
+            mode='lines+markers',
+            name='Expense',
+            line=dict(color='#f44336', width=2)
+        ))
+
+    fig.update_layout(
+        title='Monthly Income vs Expense',
+        xaxis_title='Month',
+        yaxis_title='Amount ($)'
+    )
+    return fig
+
 # Sidebar navigation
 st.sidebar.title("💰 Finance Tracker")
 st.sidebar.markdown("---")
@@ -73,27 +161,35 @@ menu = st.sidebar.radio(
 USER_ID = 1
 
 # Dashboard Page
-if menu == "📊 Dashboard":
+@st.fragment
+def _dashboard_page():
     st.title("📊 Financial Dashboard")
     st.markdown("### Overview of your finances")
     
-    # Date range selector
-    col1, col2 = st.columns(2)
-    with col1:
-        start_date = st.date_input(
-            "Start Date",
-            value=datetime.now().replace(day=1),
-            key="dashboard_start"
-        )
-    with col2:
-        end_date = st.date_input(
-            "End Date",
-            value=datetime.now(),
-            key="dashboard_end"
-        )
+    # Date range selector, batched behind Apply so changing both dates
+    # triggers a single rerun and query instead of one per widget
+    with st.form("dashboard_range"):
+        col1, col2 = st.columns(2)
+        with col1:
+            start_date = st.date_input(
+                "Start Date",
+                value=datetime.now().replace(day=1),
+                key="dashboard_start"
+            )
+        with col2:
+            end_date = st.date_input(
+                "End Date",
+                value=datetime.now(),
+                key="dashboard_end"
+            )
+        st.form_submit_button("Apply")
     
-    # Get summary
-    summary = db.get_summary(USER_ID, str(start_date), str(end_date))
+    # Get summary and recent transactions in a single round-trip, fetching
+    # only the columns the recent-transactions table displays
+    summary, recent_transactions = _dashboard_bundle(
+        USER_ID, start_date, end_date, 10,
+        columns=('date', 'type', 'category', 'amount', 'description')
+    )
     
     # Display metrics
     st.markdown("### 💳 Summary")
@@ -113,18 +209,24 @@ if menu == "📊 Dashboard":
     
     # Recent transactions
     st.markdown("### 📜 Recent Transactions")
-    recent_transactions = db.get_transactions(USER_ID, str(start_date), str(end_date))
-    
+
     if not recent_transactions.empty:
         # Display recent 10 transactions
-        display_df = recent_transactions.head(10)[['date', 'type', 'category', 'amount', 'description']]
-        display_df['amount'] = display_df['amount'].apply(lambda x: f"${x:,.2f}")
-        st.dataframe(display_df, use_container_width=True, hide_index=True)
+        st.dataframe(
+            recent_transactions,
+            column_config={
+                "amount": st.column_config.NumberColumn("Amount", format="$%.2f"),
+                "date": st.column_config.DateColumn("Date")
+            },
+            use_container_width=True,
+            hide_index=True
+        )
     else:
         st.info("No transactions found for the selected period.")
 
 # Add Transaction Page
-elif menu == "➕ Add Transaction":
+@st.fragment
+def _add_transaction_page():
     st.title("➕ Add New Transaction")
     st.markdown("### Record your income or expense")
     
@@ -159,16 +261,26 @@ elif menu == "➕ Add Transaction":
                     trans_type,
                     amount,
                     category,
-                    str(date),
+                    date,
                     description
                 )
+                _clear_query_caches()
+                # Prewarm the dashboard's default current-month view so the
+                # next navigation there hits a warm cache instead of a cold
+                # query right after the write
+                today = datetime.now().date()
+                _dashboard_bundle(
+                    USER_ID, today.replace(day=1), today, 10,
+                    columns=('date', 'type', 'category', 'amount', 'description')
+                )
                 st.success(f"✅ {trans_type} of ${amount:,.2f} added successfully!")
                 st.balloons()
             else:
                 st.error("Please enter a valid amount.")
 
 # View Transactions Page
-elif menu == "📝 View Transactions":
+@st.fragment
+def _view_transactions_page():
     st.title("📝 Transaction History")
     st.markdown("### View and filter your transactions")
     
@@ -190,15 +302,19 @@ elif menu == "📝 View Transactions":
         )
     
     with col3:
-        all_categories = ["All"] + db.get_all_categories(USER_ID)
+        all_categories = ["All"] + _categories(USER_ID)
         filter_category = st.selectbox("Category", all_categories)
     
+    # "All" means no category predicate; normalize it before it becomes a
+    # cache key so the filtered SQL never sees the sentinel
+    category_filter = None if filter_category == "All" else filter_category
+
     # Get filtered transactions
-    transactions = db.get_transactions(
+    transactions = _transactions(
         USER_ID,
-        str(filter_start),
-        str(filter_end),
-        filter_category
+        filter_start,
+        filter_end,
+        category_filter
     )
     
     if not transactions.empty:
@@ -206,12 +322,19 @@ elif menu == "📝 View Transactions":
         
         # Display transactions
         display_df = transactions[['id', 'date', 'type', 'category', 'amount', 'description']]
-        display_df['amount'] = display_df['amount'].apply(lambda x: f"${x:,.2f}")
-        st.dataframe(display_df, use_container_width=True, hide_index=True)
+        st.dataframe(
+            display_df,
+            column_config={
+                "amount": st.column_config.NumberColumn("Amount", format="$%.2f"),
+                "date": st.column_config.DateColumn("Date")
+            },
+            use_container_width=True,
+            hide_index=True
+        )
         
         # Download CSV
         st.markdown("---")
-        csv = transactions.to_csv(index=False)
+        csv = _transactions_csv(USER_ID, filter_start, filter_end, category_filter)
         st.download_button(
             label="📥 Download CSV Report",
             data=csv,
@@ -222,53 +345,56 @@ elif menu == "📝 View Transactions":
         st.info("No transactions found for the selected filters.")
 
 # Analytics Page
-elif menu == "📈 Analytics":
+@st.fragment
+def _analytics_page():
     st.title("📈 Financial Analytics")
     st.markdown("### Visualize your spending patterns")
     
-    # Date range for analytics
-    col1, col2 = st.columns(2)
-    with col1:
-        analytics_start = st.date_input(
-            "Start Date",
-            value=datetime.now().replace(day=1),
-            key="analytics_start"
-        )
-    with col2:
-        analytics_end = st.date_input(
-            "End Date",
-            value=datetime.now(),
-            key="analytics_end"
-        )
+    # Date range for analytics, batched behind Apply so changing both dates
+    # triggers a single rerun and query instead of one per widget
+    with st.form("analytics_range"):
+        col1, col2 = st.columns(2)
+        with col1:
+            analytics_start = st.date_input(
+                "Start Date",
+                value=datetime.now().replace(day=1),
+                key="analytics_start"
+            )
+        with col2:
+            analytics_end = st.date_input(
+                "End Date",
+                value=datetime.now(),
+                key="analytics_end"
+            )
+        st.form_submit_button("Apply")
     
     st.markdown("---")
     
     # Expense by Category - Pie Chart
     st.markdown("### 🥧 Expenses by Category")
-    category_data = db.get_expense_by_category(USER_ID, str(analytics_start), str(analytics_end))
+    category_data = _expense_by_category(USER_ID, analytics_start, analytics_end)
     
     if not category_data.empty:
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            fig, ax = plt.subplots(figsize=(10, 6))
-            colors = plt.cm.Set3(range(len(category_data)))
-            ax.pie(
-                category_data['amount'],
-                labels=category_data['category'],
-                autopct='%1.1f%%',
-                startangle=90,
-                colors=colors
-            )
-            ax.axis('equal')
-            plt.title('Expense Distribution by Category', fontsize=14, fontweight='bold')
-            st.pyplot(fig)
-            plt.close()
+            # Cap the slice count: keep the 9 largest categories, bucket the rest
+            if len(category_data) > 9:
+                top = category_data.nlargest(9, 'amount')
+                other = pd.DataFrame([{
+                    'category': 'Other',
+                    'amount': category_data['amount'].sum() - top['amount'].sum()
+                }])
+                plot_df = pd.concat([top, other], ignore_index=True)
+            else:
+                plot_df = category_data
+
+            st.plotly_chart(_pie_figure(plot_df), use_container_width=True)
         
         with col2:
             st.markdown("#### Category Breakdown")
-            for _, row in category_data.iterrows():
-                st.metric(row['category'], f"${row['amount']:,.2f}")
+            for cat, amt in category_data[['category', 'amount']].itertuples(index=False, name=None):
+                st.metric(cat, f"${amt:,.2f}")
     else:
         st.info("No expense data available for the selected period.")
     
@@ -276,34 +402,37 @@ elif menu == "📈 Analytics":
     
     # Income vs Expense - Line Chart
     st.markdown("### 📊 Income vs Expense Trend")
-    trend_data = db.get_monthly_trend(USER_ID)
+    trend_data = _monthly_trend(USER_ID)
     
     if not trend_data.empty:
-        # Pivot data for plotting
-        trend_pivot = trend_data.pivot(index='month', columns='type', values='total').fillna(0)
-        
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        if 'Income' in trend_pivot.columns:
-            ax.plot(trend_pivot.index, trend_pivot['Income'], marker='o', 
-                   linewidth=2, label='Income', color='#4CAF50')
-        
-        if 'Expense' in trend_pivot.columns:
-            ax.plot(trend_pivot.index, trend_pivot['Expense'], marker='s', 
-                   linewidth=2, label='Expense', color='#f44336')
+        # get_monthly_trend already returns one row per month with Income and
+        # Expense columns, so no pivot/fillna pass is needed here
+        trend_pivot = trend_data.set_index('month')
+
+        # Down-sample very long histories so the chart stays bounded by what
+        # is visually distinguishable rather than by the number of months
+        max_trend_points = 120
+        if len(trend_pivot) > max_trend_points:
+            step = -(-len(trend_pivot) // max_trend_points)
+            sampled = trend_pivot.iloc[::step]
+            if sampled.index[-1] != trend_pivot.index[-1]:
+                sampled = pd.concat([sampled, trend_pivot.iloc[[-1]]])
+            trend_pivot = sampled
         
-        ax.set_xlabel('Month', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Amount ($)', fontsize=12, fontweight='bold')
-        ax.set_title('Monthly Income vs Expense', fontsize=14, fontweight='bold')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
+        st.plotly_chart(_trend_figure(trend_pivot), use_container_width=True)
     else:
         st.info("No trend data available yet. Add more transactions to see trends.")
 
+# Each page body runs as a fragment so a widget change inside one page only
+# reruns that page instead of the whole script.
+PAGES = {
+    "📊 Dashboard": _dashboard_page,
+    "➕ Add Transaction": _add_transaction_page,
+    "📝 View Transactions": _view_transactions_page,
+    "📈 Analytics": _analytics_page,
+}
+PAGES[menu]()
+
 # Footer
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 📌 About")
@@ -1,14 +1,207 @@
 import sqlite3
 import pandas as pd
-from datetime import datetime, date
+import sys
+from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any, Union
 from contextlib import contextmanager
+import atexit
+import functools
 import logging
+import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Columns that callers may project from the transactions table
+TRANSACTION_COLUMNS = ('id', 'type', 'amount', 'category', 'description', 'date', 'created_at')
+
+# Storage formats of the datetime columns; passing these to pandas avoids
+# per-call format inference when parsing to datetime64
+DATETIME_COLUMN_FORMATS = {'date': '%Y-%m-%d', 'created_at': '%Y-%m-%d %H:%M:%S'}
+
+# Arrow-backed dtypes keep string columns out of per-cell Python objects
+# and let Streamlit serialize result frames to Arrow without converting;
+# fall back to the default numpy backend when pyarrow is not installed
+try:
+    import pyarrow  # noqa: F401
+    _READ_SQL_KWARGS = {'dtype_backend': 'pyarrow'}
+except ImportError:
+    _READ_SQL_KWARGS = {}
+
+# Hot statements are module-level constants so every execution passes the
+# exact same string and hits sqlite3's prepared-statement cache;
+# sys.intern precomputes their hashes so each cache lookup starts with
+# a pointer comparison instead of rehashing the SQL text
+INSERT_TRANSACTION_SQL = sys.intern("""
+    INSERT INTO transactions (user_id, type, amount, category, description, date)
+    VALUES (?, ?, ?, ?, ?, ?)
+""")
+
+# Static filter SQL: NULL sentinels fold every filter combination into one
+# statement, so sqlite3's statement cache reuses a single prepared plan no
+# matter which filters the caller sets. LIMIT -1 means unbounded.
+GET_TRANSACTIONS_SQL = """
+    SELECT {columns}
+    FROM transactions
+    WHERE user_id = :user_id
+      AND (:start_date IS NULL OR date >= :start_date)
+      AND (:end_date IS NULL OR date <= :end_date)
+      AND (:category IS NULL OR category = :category)
+    ORDER BY date DESC, created_at DESC
+    LIMIT :limit OFFSET :offset
+"""
+
+GET_SUMMARY_SQL = sys.intern("""
+    SELECT
+        SUM(CASE WHEN type = 'Income' THEN amount ELSE 0 END) as total_income,
+        SUM(CASE WHEN type = 'Expense' THEN amount ELSE 0 END) as total_expense,
+        COUNT(*) as transaction_count
+    FROM transactions
+    WHERE user_id = :user_id
+      AND (:start_date IS NULL OR date >= :start_date)
+      AND (:end_date IS NULL OR date <= :end_date)
+""")
+
+DELETE_TRANSACTION_SQL = sys.intern("""
+    DELETE FROM transactions
+    WHERE id = ? AND user_id = ?
+""")
+
+DELETE_TRANSACTION_RETURNING_SQL = sys.intern("""
+    DELETE FROM transactions
+    WHERE id = ? AND user_id = ?
+    RETURNING 1
+""")
+
+# RETURNING needs SQLite 3.35+ (bundled with Python 3.10 on most
+# platforms); older builds fall back to the rowcount-based bulk path
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+GET_CATEGORIES_SQL = sys.intern("""
+    SELECT DISTINCT name
+    FROM categories
+    WHERE user_id = :user_id
+      AND (:type IS NULL OR type = :type)
+    ORDER BY name
+""")
+
+# The date range predicate keeps this sargable (index range scan on
+# idx_transactions_user_date); the month spine is completed in pandas
+MONTHLY_TREND_SQL = sys.intern("""
+    SELECT
+        substr(date, 1, 7) as month,
+        type,
+        SUM(amount) as total
+    FROM transactions
+    WHERE user_id = :user_id AND date >= :start_date
+    GROUP BY month, type
+    ORDER BY month, type
+""")
+
+# All schema DDL in one script: executescript runs it in a single implicit
+# transaction, so cold start pays one commit instead of one per statement
+SCHEMA_DDL = """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        email TEXT UNIQUE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        CONSTRAINT username_length CHECK (length(username) >= 3)
+    );
+
+    CREATE TABLE IF NOT EXISTS categories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        type TEXT NOT NULL, -- 'Income' or 'Expense'
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(user_id, name, type),
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+        CONSTRAINT valid_type CHECK (type IN ('Income', 'Expense'))
+    );
+
+    CREATE TABLE IF NOT EXISTS transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        type TEXT NOT NULL,
+        amount REAL NOT NULL,
+        category TEXT NOT NULL,
+        description TEXT,
+        date DATE NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+        CONSTRAINT amount_positive CHECK (amount > 0),
+        CONSTRAINT valid_type CHECK (type IN ('Income', 'Expense'))
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_transactions_user_date
+    ON transactions(user_id, date DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_transactions_category
+    ON transactions(user_id, category);
+
+    -- Covering index so the summary CASE aggregate is satisfied from the
+    -- index alone, without per-row table lookups
+    CREATE INDEX IF NOT EXISTS idx_tx_user_date_type_amt
+    ON transactions(user_id, date, type, amount);
+
+    -- Covering index for the expense-by-category aggregate
+    -- (user_id, type equality + date range, then group/sum)
+    CREATE INDEX IF NOT EXISTS idx_tx_expense_cat
+    ON transactions(user_id, type, date, category, amount);
+
+    -- Deletes filter on (id, user_id); this lets the planner satisfy the
+    -- ownership check from one compact btree instead of a rowid lookup
+    -- followed by a user_id filter
+    CREATE INDEX IF NOT EXISTS ix_tx_user_id
+    ON transactions(user_id, id);
+
+    -- Index-only scan for the category dropdown query
+    CREATE INDEX IF NOT EXISTS idx_categories_user_type_name
+    ON categories(user_id, type, name);
+
+    INSERT OR IGNORE INTO users (id, username)
+    VALUES (1, 'default_user');
+"""
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(value: str) -> date:
+    """Parse a YYYY-MM-DD string to a date, memoizing repeated values
+
+    UI callers pass the same handful of range endpoints on every rerun;
+    after the first parse a repeated string costs a dict lookup instead
+    of a strptime call.
+
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date
+    """
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def _cached(method):
+    """Memoize an idempotent read method on (name, cache version, arguments)
+
+    Entries stay valid until the next successful write bumps the instance's
+    cache version (table-level invalidation). Mutable results are returned
+    as copies so callers cannot corrupt the cached object.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, self._cache_version, args, tuple(sorted(kwargs.items())))
+        with self._cache_lock:
+            if key in self._result_cache:
+                result = self._result_cache[key]
+                return result.copy() if hasattr(result, 'copy') else result
+        result = method(self, *args, **kwargs)
+        with self._cache_lock:
+            self._result_cache[key] = result
+        return result.copy() if hasattr(result, 'copy') else result
+    return wrapper
+
+
 class FinanceDatabase:
     """Database handler for Personal Finance Tracker with improved error handling and security"""
     
@@ -19,157 +212,245 @@ class FinanceDatabase:
             db_name (str): Name of the SQLite database file
         """
         self.db_name = db_name
+        # Serializes writers; WAL lets readers proceed concurrently
+        self._write_lock = threading.Lock()
+        # journal_mode persists in the database file; only the first
+        # connection of the process needs to set it
+        self._wal_configured = False
+        # One long-lived connection per thread: reopening per call re-parses
+        # the schema and throws away the warm page cache
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        # Cross-call result cache for idempotent reads; every successful
+        # write bumps the version, invalidating all entries at once
+        self._result_cache: Dict[tuple, Any] = {}
+        self._cache_version = 0
+        self._cache_lock = threading.Lock()
+        # Upper bound on transaction ids per user, loaded lazily; lets
+        # delete_transaction reject stale ids without a database trip.
+        # Deletes may leave it too high, which only costs the shortcut.
+        self._max_tx_id: Dict[int, int] = {}
+        atexit.register(self.close)
         self._init_database()
     
+    def _connect(self, readonly: bool = False) -> sqlite3.Connection:
+        """Open and configure a new SQLite connection
+
+        Args:
+            readonly: Open the file read-only (mode=ro URI + query_only);
+                readers then skip write-lock checks and journal bookkeeping
+
+        Returns:
+            sqlite3.Connection: Configured database connection
+        """
+        conn = sqlite3.connect(
+            f"file:{self.db_name}?mode=ro" if readonly else self.db_name,
+            uri=readonly,
+            # Autocommit: transactions are opened explicitly with
+            # BEGIN IMMEDIATE in _transaction(), never implicitly
+            isolation_level=None,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        # WAL allows concurrent readers while a writer is in flight and
+        # replaces fsync-per-commit with fsync-per-checkpoint; it is
+        # persisted in the database file, so set it only once per process
+        # (the writable connection in __init__ always comes first)
+        if not readonly and not self._wal_configured:
+            # A brand-new database adopts 8 KiB pages (fewer page reads per
+            # range scan); this must happen before WAL is entered because
+            # the page size is frozen once the file leaves rollback-journal
+            # mode. Existing files keep their size until optimize_storage().
+            if conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0:
+                conn.execute("PRAGMA page_size=8192")
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._wal_configured = True
+        # Per-connection pragmas: NORMAL synchronous is durable enough
+        # under WAL, a 64 MiB page cache plus a 256 MB mmap window keeps
+        # hot pages out of syscalls, and busy_timeout absorbs short lock
+        # contention instead of raising immediately. The mmap window turns
+        # page reads into plain memory loads at the cost of RSS growing by
+        # up to the mapped file size (and SIGBUS instead of an I/O error
+        # if the file is truncated externally) — fine for a local file
+        # well under the 256 MB cap.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA busy_timeout=5000")
+        if readonly:
+            # Defense in depth on top of mode=ro: reject any write statement
+            conn.execute("PRAGMA query_only=1")
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
     @contextmanager
-    def _get_connection(self):
-        """Context manager for database connections with error handling
-        
+    def _get_connection(self, readonly: bool = False):
+        """Context manager yielding the calling thread's cached connection
+
+        This is the connection pool: per thread, one warm writable
+        connection plus one read-only connection, each opened on first use
+        and reused for the thread's lifetime, so no call pays for
+        sqlite3.connect, pragma setup, or WAL shm mapping. Read methods ask
+        for the read-only connection (multiple-reader single-writer under
+        WAL); writers serialize on _write_lock. A shared checkout queue
+        would add hand-off overhead here for no gain, since Streamlit
+        already gives each session its own thread.
+
+        Args:
+            readonly: Yield the thread's read-only connection
+
         Yields:
             sqlite3.Connection: Database connection object
         """
-        conn = None
+        attr = 'ro_conn' if readonly else 'conn'
         try:
-            conn = sqlite3.connect(
-                self.db_name,
-                isolation_level='IMMEDIATE',
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
-            )
-            conn.row_factory = sqlite3.Row  # Enable column access by name
+            conn = getattr(self._local, attr, None)
+            if conn is None:
+                conn = self._connect(readonly=readonly)
+                setattr(self._local, attr, conn)
             yield conn
         except sqlite3.Error as e:
-            logger.error(f"Database error: {e}")
+            logger.error("Database error: %s", e)
             raise
-        finally:
-            if conn:
+
+    @contextmanager
+    def _transaction(self):
+        """Explicit BEGIN IMMEDIATE write transaction on the thread's connection
+
+        Connections run in autocommit, so writers take the reserved lock up
+        front here instead of starting deferred and failing the upgrade from
+        a read lock under contention. Commits on success, rolls back on any
+        exception; _write_lock serializes writers within this process.
+
+        Yields:
+            sqlite3.Connection: Database connection with an open transaction
+        """
+        with self._write_lock:
+            with self._get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                else:
+                    conn.execute("COMMIT")
+
+    def _invalidate_cache(self):
+        """Drop all cached read results after a write"""
+        with self._cache_lock:
+            self._cache_version += 1
+            self._result_cache.clear()
+
+    def optimize_storage(self) -> bool:
+        """Rebuild the database file with 8 KiB pages
+
+        One-off migration for databases created before the larger page
+        size. The page size cannot change under WAL, and leaving WAL
+        requires that no other connection has the file open — including
+        the pool's per-thread reader and writer handles — so this closes
+        every pooled connection and rebuilds on a dedicated one. Call it
+        from a maintenance path while no queries are in flight, never on
+        every open; WAL is restored even if the VACUUM fails.
+
+        Returns:
+            bool: True if the file was rebuilt, False if already at 8 KiB
+        """
+        with self._write_lock:
+            with self._get_connection() as conn:
+                if conn.execute("PRAGMA page_size").fetchone()[0] == 8192:
+                    return False
+            self.close()
+            conn = sqlite3.connect(self.db_name, isolation_level=None)
+            try:
+                conn.execute("PRAGMA journal_mode=DELETE")
+                conn.execute("PRAGMA page_size=8192")
+                conn.execute("VACUUM")
+                # Refresh planner statistics so index choices reflect the
+                # rebuilt file
+                conn.execute("ANALYZE")
+                logger.info("Rebuilt %s with 8 KiB pages", self.db_name)
+                return True
+            finally:
+                # Never strand the file in rollback-journal mode; pooled
+                # connections reopen lazily on the next query
+                conn.execute("PRAGMA journal_mode=WAL")
                 conn.close()
+
+    def close(self):
+        """Close every connection opened by this instance"""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
     
-    def _execute_query(self, query: str, params: tuple = (), fetch: bool = True, commit: bool = False):
-        """Execute a database query with error handling
-        
+    def _execute_scalar(self, query: str, params=()):
+        """Execute a read query and return its first result row
+
+        The fast path for single-row aggregates: no fetchall list is
+        built and no transaction handling runs.
+
         Args:
             query (str): SQL query to execute
-            params (tuple): Query parameters
-            fetch (bool): Whether to fetch results
-            commit (bool): Whether to commit the transaction
-            
+            params: Query parameters
+
         Returns:
-            Union[list, int]: Query results or last row ID
+            tuple: The first result row, or None if the query returned no rows
         """
-        with self._get_connection() as conn:
+        with self._get_connection(readonly=True) as conn:
             cursor = conn.cursor()
-            try:
-                cursor.execute(query, params)
-                if commit:
-                    conn.commit()
-                if fetch:
-                    return cursor.fetchall()
-                return cursor.lastrowid
-            except sqlite3.Error as e:
-                conn.rollback()
-                logger.error(f"Query failed: {query} - {e}")
-                raise
-    
+            # Plain tuples; positional access does not need the sqlite3.Row
+            # wrapper the connection builds for named access elsewhere
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            return cursor.fetchone()
+
     def _init_database(self):
         """Create tables if they don't exist with proper constraints and indexes"""
         try:
             with self._get_connection() as conn:
+                # One script, one implicit transaction for all DDL
+                conn.executescript(SCHEMA_DDL)
+
+                # Seed default categories only when they are not all present,
+                # so warm starts skip the executemany entirely
                 cursor = conn.cursor()
-                
-                # Enable foreign key constraints
-                cursor.execute("PRAGMA foreign_keys = ON")
-                
-                # Create users table with better schema
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS users (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        username TEXT UNIQUE NOT NULL,
-                        email TEXT UNIQUE,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        CONSTRAINT username_length CHECK (length(username) >= 3)
-                    )
-                ''')
-                
-                # Create categories table for better category management
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS categories (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id INTEGER NOT NULL,
-                        name TEXT NOT NULL,
-                        type TEXT NOT NULL, -- 'Income' or 'Expense'
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(user_id, name, type),
-                        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                        CONSTRAINT valid_type CHECK (type IN ('Income', 'Expense'))
-                    )
-                ''')
-                
-                # Create transactions table with improved schema
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS transactions (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        user_id INTEGER NOT NULL,
-                        type TEXT NOT NULL,
-                        amount REAL NOT NULL,
-                        category TEXT NOT NULL,
-                        description TEXT,
-                        date DATE NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                        CONSTRAINT amount_positive CHECK (amount > 0),
-                        CONSTRAINT valid_type CHECK (type IN ('Income', 'Expense'))
-                    )
-                ''')
-                
-                # Create indexes for better query performance
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_transactions_user_date 
-                    ON transactions(user_id, date DESC)
-                ''')
-                
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_transactions_category 
-                    ON transactions(user_id, category)
-                ''')
-                
-                # Create default user if not exists (in a more secure way)
-                cursor.execute('''
-                    INSERT OR IGNORE INTO users (id, username) 
-                    VALUES (1, 'default_user')
-                ''')
-                
-                # Create default categories if they don't exist
-                default_income_categories = [
-                    (1, 'Salary', 'Income'),
-                    (1, 'Freelance', 'Income'),
-                    (1, 'Investment', 'Income'),
-                    (1, 'Gift', 'Income'),
-                    (1, 'Other Income', 'Income')
-                ]
-                
-                default_expense_categories = [
-                    (1, 'Food', 'Expense'),
-                    (1, 'Transport', 'Expense'),
-                    (1, 'Shopping', 'Expense'),
-                    (1, 'Bills', 'Expense'),
-                    (1, 'Entertainment', 'Expense'),
-                    (1, 'Healthcare', 'Expense'),
-                    (1, 'Education', 'Expense'),
-                    (1, 'Rent', 'Expense'),
-                    (1, 'Other Expense', 'Expense')
-                ]
-                
-                cursor.executemany('''
-                    INSERT OR IGNORE INTO categories (user_id, name, type)
-                    VALUES (?, ?, ?)
-                ''', default_income_categories + default_expense_categories)
-                
-                conn.commit()
-                
+                cursor.execute("SELECT COUNT(*) FROM categories WHERE user_id = 1")
+                if cursor.fetchone()[0] < 14:
+                    default_categories = [
+                        (1, 'Salary', 'Income'),
+                        (1, 'Freelance', 'Income'),
+                        (1, 'Investment', 'Income'),
+                        (1, 'Gift', 'Income'),
+                        (1, 'Other Income', 'Income'),
+                        (1, 'Food', 'Expense'),
+                        (1, 'Transport', 'Expense'),
+                        (1, 'Shopping', 'Expense'),
+                        (1, 'Bills', 'Expense'),
+                        (1, 'Entertainment', 'Expense'),
+                        (1, 'Healthcare', 'Expense'),
+                        (1, 'Education', 'Expense'),
+                        (1, 'Rent', 'Expense'),
+                        (1, 'Other Expense', 'Expense')
+                    ]
+                    with self._transaction() as tx_conn:
+                        tx_conn.executemany('''
+                            INSERT OR IGNORE INTO categories (user_id, name, type)
+                            VALUES (?, ?, ?)
+                        ''', default_categories)
+
         except sqlite3.Error as e:
-            logger.error(f"Failed to initialize database: {e}")
+            logger.error("Failed to initialize database: %s", e)
             raise
     
     def add_transaction(
@@ -199,213 +480,96 @@ class FinanceDatabase:
             sqlite3.Error: If database operation fails
         """
         try:
-            # Convert date to string if it's a date object
-            if isinstance(transaction_date, date):
-                transaction_date = transaction_date.isoformat()
-                
-            query = """
-                INSERT INTO transactions (user_id, type, amount, category, description, date)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """
-            params = (user_id, trans_type, amount, category, description, transaction_date)
-            self._execute_query(query, params, fetch=False, commit=True)
+            self.add_transactions(user_id, [(trans_type, amount, category, transaction_date, description)])
             return True
-            
+
         except sqlite3.Error as e:
-            logger.error(f"Failed to add transaction: {e}")
+            logger.error("Failed to add transaction: %s", e)
             raise
-    
-    def get_summary(self, user_id: int, start_date: str, end_date: str) -> dict:
-        """Get financial summary for a user within a date range
-        
-        Args:
-            user_id: ID of the user
-            start_date: Start date in 'YYYY-MM-DD' format
-            end_date: End date in 'YYYY-MM-DD' format
-            
-        Returns:
-            dict: Dictionary containing summary statistics
-        """
-        try:
-            # Get total income
-            income_query = """
-                SELECT COALESCE(SUM(amount), 0) as total
-                FROM transactions
-                WHERE user_id = ? AND type = 'Income' AND date BETWEEN ? AND ?
-            """
-            income_result = self._execute_query(income_query, (user_id, start_date, end_date))
-            total_income = income_result[0]['total'] if income_result else 0
-            
-            # Get total expenses
-            expense_query = """
-                SELECT COALESCE(SUM(amount), 0) as total
-                FROM transactions
-                WHERE user_id = ? AND type = 'Expense' AND date BETWEEN ? AND ?
-            """
-            expense_result = self._execute_query(expense_query, (user_id, start_date, end_date))
-            total_expense = expense_result[0]['total'] if expense_result else 0
-            
-            # Get transaction count
-            count_query = """
-                SELECT COUNT(*) as count
-                FROM transactions
-                WHERE user_id = ? AND date BETWEEN ? AND ?
-            """
-            count_result = self._execute_query(count_query, (user_id, start_date, end_date))
-            transaction_count = count_result[0]['count'] if count_result else 0
-            
-            return {
-                'total_income': float(total_income),
-                'total_expense': float(total_expense),
-                'balance': float(total_income - total_expense),
-                'transaction_count': transaction_count
-            }
-            
-        except sqlite3.Error as e:
-            logger.error(f"Failed to get summary: {e}")
-            return {
-                'total_income': 0,
-                'total_expense': 0,
-                'balance': 0,
-                'transaction_count': 0
-            }
-    
-    def get_transactions(
-        self, 
-        user_id: int, 
-        start_date: str, 
-        end_date: str, 
-        category: str = None
-    ) -> pd.DataFrame:
-        """Get transactions for a user within a date range, optionally filtered by category
-        
-        Args:
-            user_id: ID of the user
-            start_date: Start date in 'YYYY-MM-DD' format
-            end_date: End date in 'YYYY-MM-DD' format
-            category: Optional category to filter by
-            
-        Returns:
-            pd.DataFrame: DataFrame containing transactions
-        """
-        try:
-            query = """
-                SELECT id, type, amount, category, description, date, created_at
-                FROM transactions
-                WHERE user_id = ? AND date BETWEEN ? AND ?
-            """
-            params = [user_id, start_date, end_date]
-            
-            if category and category != 'All':
-                query += " AND category = ?"
-                params.append(category)
-                
-            query += " ORDER BY date DESC"
-            
-            result = self._execute_query(query, tuple(params))
-            
-            # Convert to DataFrame
-            if result:
-                df = pd.DataFrame(result, columns=result[0].keys())
-                # Convert date strings to datetime objects
-                df['date'] = pd.to_datetime(df['date']).dt.date
-                df['created_at'] = pd.to_datetime(df['created_at'])
-                return df
-            return pd.DataFrame()
-            
-        except sqlite3.Error as e:
-            logger.error(f"Failed to get transactions: {e}")
-            return pd.DataFrame()
-    
-    def get_all_categories(self, user_id: int) -> list:
-        """Get all unique categories for a user
-        
+
+    def add_transactions(
+        self,
+        user_id: int,
+        rows: List[tuple]
+    ) -> int:
+        """Add multiple transactions in a single database transaction
+
+        Batch imports paid one commit (and one fsync) per row when looped
+        through add_transaction; executemany inside one transaction commits
+        the whole batch at once.
+
         Args:
             user_id: ID of the user
-            
+            rows: Sequence of (trans_type, amount, category, transaction_date,
+                description) tuples
+
         Returns:
-            list: List of unique categories
+            int: Number of rows inserted
+
+        Raises:
+            sqlite3.Error: If database operation fails
         """
-        try:
-            query = """
-                SELECT DISTINCT category
-                FROM transactions
-                WHERE user_id = ?
-                ORDER BY category
-            """
-            result = self._execute_query(query, (user_id,))
-            return [row['category'] for row in result]
-        except sqlite3.Error as e:
-            logger.error(f"Failed to get categories: {e}")
-            return []
-        # Input validation
+        if not rows:
+            return 0
+
         if not isinstance(user_id, int) or user_id <= 0:
             raise ValueError("Invalid user ID")
-            
-        trans_type = trans_type.capitalize()
-        if trans_type not in ('Income', 'Expense'):
-            raise ValueError("Transaction type must be 'Income' or 'Expense'")
-            
-        try:
-            amount = float(amount)
+
+        params = []
+        for trans_type, amount, category, transaction_date, description in rows:
+            trans_type = trans_type.capitalize()
+            if trans_type not in ('Income', 'Expense'):
+                raise ValueError("Transaction type must be 'Income' or 'Expense'")
+
+            try:
+                amount = float(amount)
+            except (ValueError, TypeError):
+                raise ValueError("Invalid amount")
             if amount <= 0:
                 raise ValueError("Amount must be positive")
-        except (ValueError, TypeError):
-            raise ValueError("Invalid amount")
-            
-        if not category or not isinstance(category, str):
-            raise ValueError("Category is required")
-            
-        try:
+
+            if not category or not isinstance(category, str):
+                raise ValueError("Category is required")
+
             if isinstance(transaction_date, str):
-                transaction_date = datetime.strptime(transaction_date, '%Y-%m-%d').date()
+                try:
+                    transaction_date = _parse_date(transaction_date)
+                except (ValueError, TypeError):
+                    raise ValueError("Invalid date format. Use YYYY-MM-DD")
             elif not isinstance(transaction_date, date):
-                raise ValueError("Invalid date format")
-                
-            # Ensure the date is not in the future
+                raise ValueError("Invalid date format. Use YYYY-MM-DD")
             if transaction_date > date.today():
                 raise ValueError("Transaction date cannot be in the future")
-                
-        except (ValueError, TypeError):
-            raise ValueError("Invalid date format. Use YYYY-MM-DD")
-            
+
+            params.append((user_id, trans_type, round(amount, 2), category,
+                           (description or "")[:255], transaction_date.isoformat()))
+
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Check if category exists for the user
-                cursor.execute('''
-                    SELECT 1 FROM categories 
-                    WHERE user_id = ? AND name = ? AND type = ?
-                ''', (user_id, category, trans_type))
-                
-                if not cursor.fetchone():
-                    # Add the new category
-                    cursor.execute('''
-                        INSERT INTO categories (user_id, name, type)
-                        VALUES (?, ?, ?)
-                    ''', (user_id, category, trans_type))
-                
-                # Insert the transaction
-                cursor.execute('''
-                    INSERT INTO transactions 
-                    (user_id, type, amount, category, date, description)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    user_id, 
-                    trans_type, 
-                    round(amount, 2),  # Round to 2 decimal places
-                    category, 
-                    transaction_date, 
-                    description[:255]  # Limit description length
-                ))
-                
-                conn.commit()
-                return True
-                
+            # One transaction, one commit for the whole batch; the category
+            # sync rides along so the categories table never drifts from
+            # what the transactions reference
+            with self._transaction() as conn:
+                # INSERT OR IGNORE leans on the UNIQUE(user_id, name,
+                # type) constraint, replacing the check-then-insert
+                # round trip per category
+                conn.executemany('''
+                    INSERT OR IGNORE INTO categories (user_id, name, type)
+                    VALUES (?, ?, ?)
+                ''', [(user_id, category, trans_type)
+                      for trans_type, category in {(p[1], p[3]) for p in params}])
+                conn.executemany(INSERT_TRANSACTION_SQL, params)
+            self._invalidate_cache()
+            # New rows raise the user's max id; drop the cached bound so
+            # the next delete reloads it
+            with self._cache_lock:
+                self._max_tx_id.pop(user_id, None)
+            return len(params)
+
         except sqlite3.Error as e:
-            logger.error(f"Failed to add transaction: {e}")
+            logger.error("Failed to add %d transactions: %s", len(params), e)
             raise
+
+    
     
     def get_transactions(
         self, 
@@ -414,10 +578,11 @@ class FinanceDatabase:
         end_date: Optional[Union[str, date]] = None, 
         category: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        columns: Optional[tuple] = None
     ) -> pd.DataFrame:
         """Get transactions with optional filters and pagination
-        
+
         Args:
             user_id: ID of the user
             start_date: Optional start date (inclusive)
@@ -425,7 +590,8 @@ class FinanceDatabase:
             category: Optional category filter
             limit: Maximum number of records to return
             offset: Number of records to skip
-            
+            columns: Optional subset of TRANSACTION_COLUMNS to return
+
         Returns:
             pd.DataFrame: DataFrame containing the transactions
             
@@ -439,71 +605,54 @@ class FinanceDatabase:
         # Convert date strings to date objects
         try:
             if start_date and isinstance(start_date, str):
-                start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+                start_date = _parse_date(start_date)
                 
             if end_date and isinstance(end_date, str):
-                end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+                end_date = _parse_date(end_date)
                 
             if start_date and end_date and start_date > end_date:
                 raise ValueError("Start date cannot be after end date")
                 
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid date format: {e}")
-            
+
+        if columns:
+            invalid = set(columns) - set(TRANSACTION_COLUMNS)
+            if invalid:
+                raise ValueError(f"Unknown columns: {', '.join(sorted(invalid))}")
+        else:
+            columns = TRANSACTION_COLUMNS
+
         try:
-            query = """
-                SELECT 
-                    id,
-                    type,
-                    amount,
-                    category,
-                    description,
-                    date,
-                    created_at
-                FROM transactions 
-                WHERE user_id = :user_id
-            """
-            
-            params = {"user_id": user_id}
-            
-            # Add date filters
-            if start_date:
-                query += " AND date >= :start_date"
-                params["start_date"] = start_date
-                
-            if end_date:
-                query += " AND date <= :end_date"
-                params["end_date"] = end_date
-            
-            # Add category filter
-            if category and category != "All":
-                query += " AND category = :category"
-                params["category"] = category
-            
-            # Add sorting
-            query += " ORDER BY date DESC, created_at DESC"
-            
-            # Add pagination
-            if limit is not None:
-                query += " LIMIT :limit OFFSET :offset"
-                params["limit"] = limit
-                params["offset"] = offset
-            
+            # intern the formatted projection: repeated calls with the same
+            # column set then pass the identical string object to sqlite3
+            query = sys.intern(GET_TRANSACTIONS_SQL.format(columns=', '.join(columns)))
+            params = {
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date,
+                "category": None if category in (None, "All") else category,
+                "limit": -1 if limit is None else limit,
+                "offset": offset
+            }
+
             # Use parameterized query to prevent SQL injection
-            with self._get_connection() as conn:
+            with self._get_connection(readonly=True) as conn:
                 df = pd.read_sql_query(
-                    query, 
-                    conn, 
+                    query,
+                    conn,
                     params=params,
-                    parse_dates=['date', 'created_at']
+                    parse_dates={c: f for c, f in DATETIME_COLUMN_FORMATS.items() if c in columns},
+                    **_READ_SQL_KWARGS
                 )
-                
+
             return df
             
         except sqlite3.Error as e:
-            logger.error(f"Failed to get transactions: {e}")
+            logger.error("Failed to get transactions: %s", e)
             raise
     
+    @_cached
     def get_summary(
         self, 
         user_id: int, 
@@ -528,64 +677,163 @@ class FinanceDatabase:
             raise ValueError("Invalid user ID")
             
         try:
-            query = """
-                SELECT 
-                    SUM(CASE WHEN type = 'Income' THEN amount ELSE 0 END) as total_income,
-                    SUM(CASE WHEN type = 'Expense' THEN amount ELSE 0 END) as total_expense,
-                    COUNT(*) as transaction_count
-                FROM transactions 
-                WHERE user_id = :user_id
-            """
-            
-            params = {"user_id": user_id}
-            
-            # Add date filters
-            if start_date:
-                if isinstance(start_date, str):
-                    start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-                query += " AND date >= :start_date"
-                params["start_date"] = start_date
+            if start_date and isinstance(start_date, str):
+                start_date = _parse_date(start_date)
+            if end_date and isinstance(end_date, str):
+                end_date = _parse_date(end_date)
+
+            params = {
+                "user_id": user_id,
+                "start_date": start_date,
+                "end_date": end_date
+            }
+
+            result = self._execute_scalar(GET_SUMMARY_SQL, params)
+
+            if not result or result[0] is None:  # No transactions found
+                return {
+                    'total_income': 0.0,
+                    'total_expense': 0.0,
+                    'balance': 0.0,
+                    'transaction_count': 0
+                }
+
+            total_income = float(result[0] or 0)
+            total_expense = float(result[1] or 0)
+            transaction_count = result[2] or 0
+
+            return {
+                'total_income': round(total_income, 2),
+                'total_expense': round(total_expense, 2),
+                'balance': round(total_income - total_expense, 2),
+                'transaction_count': transaction_count
+            }
                 
-            if end_date:
-                if isinstance(end_date, str):
-                    end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
-                query += " AND date <= :end_date"
-                params["end_date"] = end_date
-            
-            with self._get_connection() as conn:
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid date format: {e}")
+        except sqlite3.Error as e:
+            logger.error("Failed to get summary: %s", e)
+            raise
+    
+    def get_dashboard_bundle(
+        self,
+        user_id: int,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        limit: Optional[int] = None,
+        columns: Optional[tuple] = None
+    ) -> tuple:
+        """Get the financial summary and recent transactions in one round-trip
+
+        The dashboard needs both the aggregate summary and the most recent
+        transactions for the same (user, date range); running both queries
+        over a single connection avoids a second connect/teardown cycle.
+
+        Args:
+            user_id: ID of the user
+            start_date: Optional start date (inclusive)
+            end_date: Optional end date (inclusive)
+            limit: Maximum number of recent transactions to return
+            columns: Optional subset of TRANSACTION_COLUMNS to return
+
+        Returns:
+            tuple: (summary dict, transactions DataFrame)
+
+        Raises:
+            ValueError: If input validation fails
+            sqlite3.Error: If database operation fails
+        """
+        if not isinstance(user_id, int) or user_id <= 0:
+            raise ValueError("Invalid user ID")
+
+        try:
+            if start_date and isinstance(start_date, str):
+                start_date = _parse_date(start_date)
+
+            if end_date and isinstance(end_date, str):
+                end_date = _parse_date(end_date)
+
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Invalid date format: {e}")
+
+        if columns:
+            invalid = set(columns) - set(TRANSACTION_COLUMNS)
+            if invalid:
+                raise ValueError(f"Unknown columns: {', '.join(sorted(invalid))}")
+        else:
+            columns = TRANSACTION_COLUMNS
+
+        summary_query = """
+            SELECT
+                SUM(CASE WHEN type = 'Income' THEN amount ELSE 0 END) as total_income,
+                SUM(CASE WHEN type = 'Expense' THEN amount ELSE 0 END) as total_expense,
+                COUNT(*) as transaction_count
+            FROM transactions
+            WHERE user_id = :user_id
+        """
+
+        transactions_query = f"""
+            SELECT {', '.join(columns)}
+            FROM transactions
+            WHERE user_id = :user_id
+        """
+
+        params = {"user_id": user_id}
+
+        # Add date filters to both queries
+        if start_date:
+            summary_query += " AND date >= :start_date"
+            transactions_query += " AND date >= :start_date"
+            params["start_date"] = start_date
+
+        if end_date:
+            summary_query += " AND date <= :end_date"
+            transactions_query += " AND date <= :end_date"
+            params["end_date"] = end_date
+
+        transactions_query += " ORDER BY date DESC, created_at DESC"
+
+        transactions_params = dict(params)
+        if limit is not None:
+            transactions_query += " LIMIT :limit"
+            transactions_params["limit"] = limit
+
+        try:
+            with self._get_connection(readonly=True) as conn:
                 cursor = conn.cursor()
-                cursor.execute(query, params)
+                cursor.execute(summary_query, params)
                 result = cursor.fetchone()
-                
-                if not result or result[0] is None:  # No transactions found
-                    return {
-                        'total_income': 0.0,
-                        'total_expense': 0.0,
-                        'balance': 0.0,
-                        'transaction_count': 0
-                    }
-                
-                total_income = float(result[0] or 0)
-                total_expense = float(result[1] or 0)
-                transaction_count = result[2] or 0
-                
-                return {
+
+                total_income = float(result[0] or 0) if result else 0.0
+                total_expense = float(result[1] or 0) if result else 0.0
+                transaction_count = (result[2] or 0) if result else 0
+
+                summary = {
                     'total_income': round(total_income, 2),
                     'total_expense': round(total_expense, 2),
                     'balance': round(total_income - total_expense, 2),
                     'transaction_count': transaction_count
                 }
-                
-        except (ValueError, TypeError) as e:
-            raise ValueError(f"Invalid date format: {e}")
+
+                transactions = pd.read_sql_query(
+                    transactions_query,
+                    conn,
+                    params=transactions_params,
+                    parse_dates={c: f for c, f in DATETIME_COLUMN_FORMATS.items() if c in columns},
+                    **_READ_SQL_KWARGS
+                )
+
+            return summary, transactions
+
         except sqlite3.Error as e:
-            logger.error(f"Failed to get summary: {e}")
+            logger.error("Failed to get dashboard bundle: %s", e)
             raise
-    
+
+    @_cached
     def get_expense_by_category(
-        self, 
-        user_id: int, 
-        start_date: Optional[Union[str, date]] = None, 
+        self,
+        user_id: int,
+        start_date: Optional[Union[str, date]] = None,
         end_date: Optional[Union[str, date]] = None,
         limit: Optional[int] = None
     ) -> pd.DataFrame:
@@ -622,13 +870,13 @@ class FinanceDatabase:
             # Add date filters
             if start_date:
                 if isinstance(start_date, str):
-                    start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+                    start_date = _parse_date(start_date)
                 query += " AND date >= :start_date"
                 params["start_date"] = start_date
                 
             if end_date:
                 if isinstance(end_date, str):
-                    end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+                    end_date = _parse_date(end_date)
                 query += " AND date <= :end_date"
                 params["end_date"] = end_date
             
@@ -641,8 +889,8 @@ class FinanceDatabase:
                 query += " LIMIT :limit"
                 params["limit"] = limit
             
-            with self._get_connection() as conn:
-                df = pd.read_sql_query(query, conn, params=params)
+            with self._get_connection(readonly=True) as conn:
+                df = pd.read_sql_query(query, conn, params=params, **_READ_SQL_KWARGS)
                 
                 # Ensure consistent return format
                 if df.empty:
@@ -653,9 +901,10 @@ class FinanceDatabase:
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid date format: {e}")
         except sqlite3.Error as e:
-            logger.error(f"Failed to get expenses by category: {e}")
+            logger.error("Failed to get expenses by category: %s", e)
             raise
     
+    @_cached
     def get_monthly_trend(
         self, 
         user_id: int, 
@@ -682,72 +931,53 @@ class FinanceDatabase:
             
         try:
             # Calculate the start date (months ago from today)
-            from datetime import date, timedelta
             end_date = date.today()
             start_date = (end_date - timedelta(days=months*30)).replace(day=1)
-            
-            query = """
-                WITH RECURSIVE months(month) AS (
-                    SELECT :start_date
-                    UNION ALL
-                    SELECT date(month, '+1 month')
-                    FROM months
-                    WHERE month < date(:end_date, 'start of month')
-                )
-                SELECT 
-                    strftime('%Y-%m', m.month) as month,
-                    t.type,
-                    COALESCE(SUM(tr.amount), 0) as total
-                FROM months m
-                CROSS JOIN (SELECT 'Income' as type UNION SELECT 'Expense') t
-                LEFT JOIN transactions tr ON 
-                    strftime('%Y-%m', tr.date) = strftime('%Y-%m', m.month) AND
-                    tr.user_id = :user_id AND
-                    tr.type = t.type
-                GROUP BY m.month, t.type
-                ORDER BY m.month, t.type
-            """
-            
+
             params = {
                 'user_id': user_id,
-                'start_date': start_date.strftime('%Y-%m-%d'),
-                'end_date': end_date.strftime('%Y-%m-%d')
+                'start_date': start_date.strftime('%Y-%m-%d')
             }
-            
-            with self._get_connection() as conn:
-                df = pd.read_sql_query(query, conn, params=params)
-                
-                # Ensure we have all months in the range, even with no transactions
-                if not df.empty:
-                    # Pivot the data for easier analysis
-                    pivot_df = df.pivot(index='month', columns='type', values='total').fillna(0)
-                    
-                    # Ensure both Income and Expense columns exist
-                    for col in ['Income', 'Expense']:
-                        if col not in pivot_df.columns:
-                            pivot_df[col] = 0.0
-                    
-                    # Reset index to make month a column again
-                    result_df = pivot_df.reset_index()
-                    
-                    # Calculate balance
-                    result_df['Balance'] = result_df['Income'] - result_df['Expense']
-                    
-                    return result_df
-                
+
+            with self._get_connection(readonly=True) as conn:
+                df = pd.read_sql_query(MONTHLY_TREND_SQL, conn, params=params)
+
+            if df.empty:
                 return pd.DataFrame(columns=['month', 'Income', 'Expense', 'Balance'])
-                
+
+            # SQL only returns (month, type) pairs that have transactions;
+            # complete the month x type grid with one MultiIndex reindex so
+            # every month in the range carries both columns, zero-filled
+            months = pd.period_range(start_date, end_date, freq='M').strftime('%Y-%m')
+            grid = pd.MultiIndex.from_product(
+                [months, ['Income', 'Expense']], names=['month', 'type']
+            )
+            totals = df.set_index(['month', 'type'])['total'].reindex(grid, fill_value=0.0)
+            result_df = totals.unstack('type').reset_index()
+
+            # Calculate balance
+            result_df['Balance'] = result_df['Income'] - result_df['Expense']
+
+            if _READ_SQL_KWARGS:
+                result_df = result_df.convert_dtypes(dtype_backend='pyarrow')
+            return result_df
+
         except sqlite3.Error as e:
-            logger.error(f"Failed to get monthly trend: {e}")
+            logger.error("Failed to get monthly trend: %s", e)
             raise
     
+    @_cached
     def get_all_categories(
         self, 
         user_id: int, 
         trans_type: Optional[str] = None
     ) -> List[str]:
         """Get all unique categories for a user, optionally filtered by type
-        
+
+        Results are memoized per argument set by _cached; any successful
+        write bumps the cache version, so page renders between writes
+        never touch SQLite for this list.
+
         Args:
             user_id: ID of the user
             trans_type: Optional type filter ('Income' or 'Expense')
@@ -766,27 +996,20 @@ class FinanceDatabase:
             raise ValueError("Type must be 'Income' or 'Expense'")
             
         try:
-            query = """
-                SELECT DISTINCT name 
-                FROM categories 
-                WHERE user_id = :user_id
-            """
-            
-            params = {"user_id": user_id}
-            
-            if trans_type:
-                query += " AND type = :type"
-                params["type"] = trans_type.capitalize()
-                
-            query += " ORDER BY name"
-            
-            with self._get_connection() as conn:
+            params = {
+                "user_id": user_id,
+                "type": trans_type.capitalize() if trans_type else None
+            }
+
+            with self._get_connection(readonly=True) as conn:
                 cursor = conn.cursor()
-                cursor.execute(query, params)
-                return [row[0] for row in cursor.fetchall()]
+                # Plain tuples, consumed lazily: no sqlite3.Row wrapper and
+                # no intermediate fetchall list between SQLite and the result
+                cursor.row_factory = None
+                return [name for (name,) in cursor.execute(GET_CATEGORIES_SQL, params)]
                 
         except sqlite3.Error as e:
-            logger.error(f"Failed to get categories: {e}")
+            logger.error("Failed to get categories: %s", e)
             raise
     
     def delete_transaction(self, user_id: int, transaction_id: int) -> bool:
@@ -803,34 +1026,110 @@ class FinanceDatabase:
             ValueError: If input validation fails
             sqlite3.Error: If database operation fails
         """
+        # int() both coerces and validates in one step; cheaper than
+        # isinstance checks and it accepts integer-like inputs such as
+        # numpy ids coming out of DataFrames
+        try:
+            user_id = int(user_id)
+            transaction_id = int(transaction_id)
+            if user_id <= 0 or transaction_id <= 0:
+                raise ValueError
+        except (TypeError, ValueError):
+            raise ValueError("Invalid user or transaction ID")
+
+        # Stale UI state regularly retries ids that were already deleted;
+        # anything above the user's max id cannot exist, so answer those
+        # from the cached bound without opening a transaction
+        with self._cache_lock:
+            max_id = self._max_tx_id.get(user_id)
+        if max_id is None:
+            row = self._execute_scalar(
+                "SELECT MAX(id) FROM transactions WHERE user_id = ?",
+                (user_id,)
+            )
+            max_id = row[0] if row and row[0] is not None else 0
+            with self._cache_lock:
+                self._max_tx_id[user_id] = max_id
+        if transaction_id > max_id:
+            return False
+
+        if not _SUPPORTS_RETURNING:
+            return self.delete_transactions(user_id, [transaction_id]) == 1
+
+        try:
+            # RETURNING folds the hit test into the delete itself:
+            # fetchone() is a row when something was deleted and
+            # None otherwise, with no reliance on rowcount
+            with self._transaction() as conn:
+                cursor = conn.execute(
+                    DELETE_TRANSACTION_RETURNING_SQL,
+                    (transaction_id, user_id)
+                )
+                deleted = cursor.fetchone() is not None
+            if deleted:
+                self._invalidate_cache()
+            return deleted
+
+        except sqlite3.Error as e:
+            logger.error("Failed to delete transaction %s: %s", transaction_id, e)
+            raise
+
+    def delete_transactions(
+        self,
+        user_id: int,
+        transaction_ids: List[int]
+    ) -> int:
+        """Delete multiple transactions in a single database transaction
+
+        Looping delete_transaction pays one commit per row; executemany
+        inside one transaction deletes the whole batch with a single
+        commit. Rows that do not exist or belong to another user are
+        skipped, not errors.
+
+        Categories are deliberately left in place when their last
+        transaction goes away: the categories table also carries the
+        seeded defaults, which have no transactions at all, so pruning
+        unreferenced names would empty the dropdowns.
+
+        Args:
+            user_id: ID of the user making the request
+            transaction_ids: IDs of the transactions to delete
+
+        Returns:
+            int: Number of rows actually deleted
+
+        Raises:
+            ValueError: If input validation fails
+            sqlite3.Error: If database operation fails
+        """
+        if not transaction_ids:
+            return 0
+
         if not isinstance(user_id, int) or user_id <= 0:
             raise ValueError("Invalid user ID")
-            
-        if not isinstance(transaction_id, int) or transaction_id <= 0:
+
+        try:
+            ids = [int(tid) for tid in transaction_ids]
+        except (ValueError, TypeError):
             raise ValueError("Invalid transaction ID")
-            
+
+        deleted = 0
         try:
-            with self._get_connection() as conn:
+            # _transaction commits once on success and rolls back on
+            # exception, so a failing chunk can never leave a partial
+            # batch behind
+            with self._transaction() as conn:
                 cursor = conn.cursor()
-                
-                # First verify the transaction exists and belongs to the user
-                cursor.execute('''
-                    SELECT 1 FROM transactions 
-                    WHERE id = ? AND user_id = ?
-                ''', (transaction_id, user_id))
-                
-                if not cursor.fetchone():
-                    return False  # Transaction not found or not owned by user
-                
-                # Delete the transaction
-                cursor.execute('''
-                    DELETE FROM transactions 
-                    WHERE id = ? AND user_id = ?
-                ''', (transaction_id, user_id))
-                
-                conn.commit()
-                return True
-                
+                for i in range(0, len(ids), 500):
+                    cursor.executemany(
+                        DELETE_TRANSACTION_SQL,
+                        [(tid, user_id) for tid in ids[i:i + 500]]
+                    )
+                    deleted += cursor.rowcount
+            if deleted:
+                self._invalidate_cache()
+            return deleted
+
         except sqlite3.Error as e:
-            logger.error(f"Failed to delete transaction {transaction_id}: {e}")
+            logger.error("Failed to delete %d transactions: %s", len(ids), e)
             raise